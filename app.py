@@ -1,17 +1,31 @@
 #!/usr/bin/env python3
 
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, request, render_template, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import sqlite3
+import queue
 import threading
 import time
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import datetime
 import uuid
 import os
 import logging
 from logging.handlers import RotatingFileHandler
+from markupsafe import escape
+import orjson
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (compact, unsorted keys)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
 
@@ -22,24 +36,64 @@ app = Flask(__name__)
 # Re‑enable both hourly and daily limits.
 app.config['DEBUG'] = os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
 app.config['ENV'] = os.environ.get('FLASK_ENV', 'production')
-app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+# Flask-internal JSON (request.get_json, errors from extensions) goes through
+# orjson too; views answer with ojson() below.
+app.json = OrjsonProvider(app)
 
 # ----------------------------------------------------------------------
 # CORS & Rate Limiting
 # ----------------------------------------------------------------------
 CORS(app, resources={r"/*": {"origins": "*"}})
 
-# No rate limits are applied globally.
+# No rate limits are applied globally.  Timer creation is the only endpoint
+# worth limiting; set RATELIMIT_CREATE (e.g. "200 per day;50 per hour") to
+# enable it.  Every other route is exempt so polling never pays for the check.
 limiter = Limiter(
     app=app,
     key_func=get_remote_address,
     default_limits=[]  # No rate limits
 )
+CREATE_TIMER_LIMIT = os.environ.get('RATELIMIT_CREATE', '')
+create_timer_limit = limiter.limit(CREATE_TIMER_LIMIT) if CREATE_TIMER_LIMIT else (lambda view: view)
 
 # ----------------------------------------------------------------------
 # Database setup
 # ----------------------------------------------------------------------
 DB_PATH = os.environ.get('DB_PATH', 'timers.db')
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '10'))
+
+# Keeping the SQL as constants means every call hits the same entry in each
+# pooled connection's statement cache, so statements are only prepared once
+# per connection.  Columns are listed explicitly rather than SELECT *.
+DB_CACHED_STATEMENTS = 256
+TIMER_COLUMNS = 'id, name, duration_seconds, created_at, expires_at'
+SQL_INSERT = f'INSERT INTO timers ({TIMER_COLUMNS}) VALUES (?, ?, ?, ?, ?)'
+SQL_LIST = f'SELECT {TIMER_COLUMNS} FROM timers'
+# An identifier may be either a timer id or a timer name
+SQL_FIND = f'SELECT {TIMER_COLUMNS} FROM timers WHERE id = ?1 OR name = ?1 ORDER BY id = ?1 DESC LIMIT 1'
+# Deletes by id if one matches, otherwise every timer with that name (the
+# same precedence as SQL_FIND).  The target rows are collected in a subquery
+# first: with a plain WHERE, SQLite may delete the id match before testing
+# NOT EXISTS for the name branch, and then delete the name match as well.
+SQL_DELETE = '''
+    DELETE FROM timers WHERE rowid IN (
+        SELECT rowid FROM timers WHERE id = ?1
+        UNION ALL
+        SELECT rowid FROM timers WHERE name = ?1 AND NOT EXISTS (SELECT 1 FROM timers WHERE id = ?1)
+    )
+'''
+# Bumped by triggers on every insert/delete, in the same transaction as the
+# change, so all workers agree on it (see init_db).
+SQL_TIMERS_SEQ = 'SELECT seq FROM timers_seq'
+
+# Expired timers are removed in batches so no single cleanup transaction
+# holds the write lock for long.
+CLEANUP_BATCH_SIZE = 1000
+SQL_DELETE_EXPIRED = f'''
+    DELETE FROM timers WHERE id IN (
+        SELECT id FROM timers WHERE expires_at <= ? ORDER BY expires_at LIMIT {CLEANUP_BATCH_SIZE}
+    )
+'''
 
 # Logging setup
 if not app.debug:
@@ -50,86 +104,248 @@ if not app.debug:
     app.logger.addHandler(handler)
     app.logger.setLevel(logging.INFO)
 
-def get_db_connection():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+def _open_connection():
+    # isolation_level=None puts the driver in autocommit mode: single-statement
+    # writes commit on their own, and multi-statement work opens its own
+    # transaction explicitly (see cleanup_expired_timers).
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=DB_CACHED_STATEMENTS
+    )
     conn.row_factory = sqlite3.Row
+    # These settings are per-connection; journal_mode=WAL (set in init_db)
+    # persists in the database file itself.
+    conn.execute('PRAGMA busy_timeout=5000')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA cache_size=-8000')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=134217728')
     return conn
 
+# Connections are opened lazily up to DB_POOL_SIZE and then reused; once the
+# pool is exhausted callers block on the queue (which yields to other
+# greenlets under gevent) instead of opening more.
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+_db_pool_lock = threading.Lock()
+_db_pool_opened = 0
+
+@contextmanager
+def db_conn():
+    """Borrow a pooled connection for the duration of a ``with`` block."""
+    global _db_pool_opened
+    try:
+        conn = _db_pool.get_nowait()
+    except queue.Empty:
+        with _db_pool_lock:
+            can_open = _db_pool_opened < DB_POOL_SIZE
+            if can_open:
+                _db_pool_opened += 1
+        if can_open:
+            try:
+                conn = _open_connection()
+            except Exception:
+                with _db_pool_lock:
+                    _db_pool_opened -= 1
+                raise
+        else:
+            conn = _db_pool.get()
+    try:
+        yield conn
+    finally:
+        # Never hand a half-finished transaction to the next borrower
+        if conn.in_transaction:
+            conn.rollback()
+        _db_pool.put(conn)
+
+def _rows_raw(conn: sqlite3.Connection, sql: str, *params) -> list:
+    """
+    Run a query and return plain tuples, bypassing the connection's Row
+    factory; used by the list endpoints, which index columns by position.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params).fetchall()
+
 def init_db():
-    conn = get_db_connection()
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS timers (
-            id TEXT PRIMARY KEY,
-            name TEXT,
-            duration_seconds INTEGER,
-            created_at TIMESTAMP,
-            expires_at TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    with db_conn() as conn:
+        # WAL lets readers proceed while a writer commits, and with
+        # synchronous=NORMAL a commit only needs to sync the -wal file.
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS timers (
+                id TEXT PRIMARY KEY,
+                name TEXT,
+                duration_seconds INTEGER,
+                created_at INTEGER,
+                expires_at INTEGER
+            )
+        ''')
+        # Older databases stored local-time ISO-8601 strings; convert them to
+        # unix epoch seconds so comparisons (and the index) are integer based.
+        conn.execute('''
+            UPDATE timers
+            SET created_at = CAST(strftime('%s', created_at, 'utc') AS INTEGER),
+                expires_at = CAST(strftime('%s', expires_at, 'utc') AS INTEGER)
+            WHERE typeof(expires_at) = 'text'
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_timers_expires_at ON timers(expires_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_timers_name ON timers(name) WHERE name IS NOT NULL')
+        # Single-row mutation counter used as the ETag of the list endpoints.
+        # Kept in the database rather than in memory so every Gunicorn worker,
+        # and the cleanup loop, see and bump the same value.
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS timers_seq (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                seq INTEGER NOT NULL
+            )
+        ''')
+        conn.execute('INSERT OR IGNORE INTO timers_seq (id, seq) VALUES (0, 0)')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS timers_seq_insert AFTER INSERT ON timers
+            BEGIN UPDATE timers_seq SET seq = seq + 1; END
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS timers_seq_delete AFTER DELETE ON timers
+            BEGIN UPDATE timers_seq SET seq = seq + 1; END
+        ''')
 
 # ----------------------------------------------------------------------
 # Helper utilities
 # ----------------------------------------------------------------------
-def format_seconds(seconds: int) -> str:
-    """Return a HH:MM:SS string for a non‑negative number of seconds."""
-    seconds = max(0, seconds)
-    hours, remainder = divmod(seconds, 3600)
-    minutes, secs = divmod(remainder, 60)
-    return f"{int(hours):02d}:{int(minutes):02d}:{int(secs):02d}"
+# Row markup for /timers/simple, parsed once.  Every interpolated value must be
+# HTML-safe already (the timer name is user input and goes through escape()).
+# The time left is filled in and ticked by static/timer_renderer.js from
+# data-expires, so a row never changes while the timer exists.
+_TIMER_ROW_HTML = '''
+            <div class="timer-item" data-timer-id="{id}">
+                <div class="timer-info">
+                    <div class="timer-name">{name}</div>
+                    <div class="timer-time">
+                        <span class="time-left" data-expires="{expires_at}">--:--:--</span> left
+                        (created: {created_at})
+                    </div>
+                </div>
+                <div class="timer-actions">
+                    <button 
+                        class="delete-btn" 
+                        hx-delete="/timers/{id}" 
+                        hx-target="#timer-list"
+                    >
+                        Delete
+                    </button>
+                </div>
+            </div>
+            '''.format
+
+# Rendered bodies of the list endpoints, keyed by endpoint, as
+# (timers_seq value when built, body).  The bodies contain nothing
+# time-dependent, so one stays valid until the mutation counter moves.
+_list_cache = {}
+
+def get_cached_list(key, seq):
+    entry = _list_cache.get(key)
+    if entry is not None and entry[0] == seq:
+        return entry[1]
+    return None
+
+def set_cached_list(key, seq, body):
+    _list_cache[key] = (seq, body)
+
+def ojson(payload, status: int = 200):
+    """Serialize `payload` with orjson straight to response bytes."""
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
 
 def timer_to_dict(row: sqlite3.Row) -> dict:
     """
     Convert a DB row into the JSON shape expected by the front‑end
-    (id, name, time_left, expired).
+    (id, name, duration_seconds, created_at, expires_at).
+
+    Timestamps are unix epoch seconds.  The client derives the time left from
+    `expires_at`, so the payload only changes when timers are added or removed.
     """
-    expires_at = datetime.fromisoformat(row['expires_at'])
-    now = datetime.now()
-    time_left_seconds = int((expires_at - now).total_seconds())
-    expired = time_left_seconds <= 0
     return {
         'id': row['id'],
         'name': row['name'],
-        'time_left': format_seconds(time_left_seconds),
-        'expired': expired
+        'duration_seconds': row['duration_seconds'],
+        'created_at': row['created_at'],
+        'expires_at': row['expires_at']
     }
 
+def cacheable_response(seq: int, body=None, mimetype=None):
+    """
+    Wrap a list body so browsers and proxies keep it but revalidate it with
+    If-None-Match on every use instead of downloading it again; no-cache
+    (rather than a max-age) means a list fetched right after a create is
+    never served stale.  Without a body this is the 304 answer to a
+    matching If-None-Match.
+    """
+    if body is None:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype=mimetype)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.set_etag(str(seq))
+    return response
+
 # ----------------------------------------------------------------------
-# Timer cleanup thread
+# Expired timer cleanup
 # ----------------------------------------------------------------------
-class TimerCleanupThread(threading.Thread):
-    def __init__(self):
-        super().__init__()
-        self.daemon = True
-        self.running = True
-    
-    def run(self):
-        while self.running:
-            time.sleep(60)  # Clean up every minute
-            self.cleanup_expired_timers()
-    
-    def cleanup_expired_timers(self):
-        try:
-            conn = get_db_connection()
-            now = datetime.now()
-            conn.execute('DELETE FROM timers WHERE expires_at <= ?', (now.isoformat(),))
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"Error cleaning up expired timers: {e}")
-    
-    def stop(self):
-        self.running = False
+CLEANUP_INTERVAL_SECONDS = 60
+
+def cleanup_expired_timers():
+    try:
+        now = int(time.time())
+        with db_conn() as conn:
+            while True:
+                conn.execute('BEGIN IMMEDIATE')
+                cursor = conn.execute(SQL_DELETE_EXPIRED, (now,))
+                conn.execute('COMMIT')
+                if cursor.rowcount < CLEANUP_BATCH_SIZE:
+                    break
+    except Exception as e:
+        print(f"Error cleaning up expired timers: {e}")
+
+def checkpoint_wal():
+    """Fold the -wal file back into the database so it doesn't grow unbounded."""
+    try:
+        with db_conn() as conn:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    except Exception as e:
+        print(f"Error checkpointing WAL: {e}")
 
-# Initialize cleanup thread
-cleanup_thread = TimerCleanupThread()
-cleanup_thread.start()
+def _cleanup_loop(sleep):
+    while True:
+        sleep(CLEANUP_INTERVAL_SECONDS)
+        cleanup_expired_timers()
+        checkpoint_wal()
+
+def start_cleanup():
+    """
+    Start the periodic cleanup loop in the current process.
+
+    Gunicorn calls this from ``post_worker_init`` so each gevent worker runs
+    it as a greenlet; the development server falls back to a daemon thread.
+    Set WEBTIMER_CLEANUP=0 to disable it (e.g. when cleanup runs elsewhere).
+    """
+    if os.environ.get('WEBTIMER_CLEANUP', '1') != '1':
+        return
+    try:
+        import gevent
+        from gevent import monkey
+    except ImportError:
+        gevent = None
+    if gevent is not None and monkey.is_module_patched('time'):
+        gevent.spawn(_cleanup_loop, gevent.sleep)
+    else:
+        threading.Thread(target=_cleanup_loop, args=(time.sleep,), daemon=True).start()
 
 # ----------------------------------------------------------------------
 # Routes
 # ----------------------------------------------------------------------
 @app.route('/timers', methods=['POST'])
+@create_timer_limit
 def create_timer():
     # Handle both JSON and form data
     if request.is_json:
@@ -146,82 +362,65 @@ def create_timer():
         try:
             duration_seconds = int(duration_seconds)
         except ValueError:
-            return jsonify({'error': 'duration_seconds must be a valid number'}), 400
+            return ojson({'error': 'duration_seconds must be a valid number'}, 400)
     
     if not duration_seconds:
-        return jsonify({'error': 'duration_seconds is required'}), 400
+        return ojson({'error': 'duration_seconds is required'}, 400)
     
     if duration_seconds <= 0:
-        return jsonify({'error': 'duration_seconds must be positive'}), 400
+        return ojson({'error': 'duration_seconds must be positive'}, 400)
     
     timer_id = str(uuid.uuid4())
-    created_at = datetime.now()
-    expires_at = created_at + timedelta(seconds=duration_seconds)
+    created_at = int(time.time())
+    expires_at = created_at + int(duration_seconds)
     
     try:
-        conn = get_db_connection()
-        conn.execute('''
-            INSERT INTO timers (id, name, duration_seconds, created_at, expires_at)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (timer_id, name, duration_seconds, created_at.isoformat(), expires_at.isoformat()))
-        conn.commit()
-        conn.close()
+        with db_conn() as conn:
+            conn.execute(SQL_INSERT, (timer_id, name, duration_seconds, created_at, expires_at))
         
         # Return the same shape the front‑end expects
-        return jsonify({
+        return ojson({
             'id': timer_id,
             'name': name,
-            'time_left': format_seconds(duration_seconds),
-            'expired': False
-        }), 201
+            'duration_seconds': duration_seconds,
+            'created_at': created_at,
+            'expires_at': expires_at
+        }, 201)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/timers/<identifier>', methods=['GET'])
+@limiter.exempt
 def get_timer(identifier):
     try:
-        conn = get_db_connection()
-        
-        # Try to find by ID first
-        timer = conn.execute('SELECT * FROM timers WHERE id = ?', (identifier,)).fetchone()
-        
-        # If not found by ID, try to find by name
-        if not timer:
-            timer = conn.execute('SELECT * FROM timers WHERE name = ?', (identifier,)).fetchone()
-        
-        conn.close()
+        with db_conn() as conn:
+            # Matches by ID first, then by name
+            timer = conn.execute(SQL_FIND, (identifier,)).fetchone()
         
         if not timer:
-            return jsonify({'error': 'Timer not found'}), 404
+            return ojson({'error': 'Timer not found'}, 404)
         
         # Return the shape expected by timer_renderer.js
-        return jsonify(timer_to_dict(timer))
+        return ojson(timer_to_dict(timer))
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/timers/<identifier>', methods=['DELETE'])
+@limiter.exempt
 def delete_timer(identifier):
     try:
-        conn = get_db_connection()
-        
-        # Try to delete by ID first
-        cursor = conn.execute('DELETE FROM timers WHERE id = ?', (identifier,))
+        with db_conn() as conn:
+            cursor = conn.execute(SQL_DELETE, (identifier,))
         
-        # If not found by ID, try to delete by name
         if cursor.rowcount == 0:
-            cursor = conn.execute('DELETE FROM timers WHERE name = ?', (identifier,))
-        
-        conn.commit()
-        conn.close()
+            return ojson({'error': 'Timer not found'}, 404)
         
-        if cursor.rowcount == 0:
-            return jsonify({'error': 'Timer not found'}), 404
-        
-        return jsonify({'message': 'Timer deleted successfully'}), 200
+        return ojson({'message': 'Timer deleted successfully'}, 200)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/timers', methods=['GET'])
+@limiter.exempt
 def list_timers():
     """
     Return a JSON array of all timers in the shape required by
@@ -229,102 +428,85 @@ def list_timers():
         {
             id: string,
             name: string | null,
-            time_left: "HH:MM:SS",
-            expired: boolean
+            duration_seconds: number,
+            created_at: number,   // unix epoch seconds
+            expires_at: number    // unix epoch seconds
         }
     """
     try:
-        conn = get_db_connection()
-        timers = conn.execute('SELECT * FROM timers').fetchall()
-        conn.close()
-        
-        result = [timer_to_dict(timer) for timer in timers]
-        return jsonify(result), 200
+        with db_conn() as conn:
+            seq = conn.execute(SQL_TIMERS_SEQ).fetchone()[0]
+            if request.if_none_match.contains(str(seq)):
+                return cacheable_response(seq)
+            
+            body = get_cached_list('json', seq)
+            if body is None:
+                # Column order is TIMER_COLUMNS
+                body = orjson.dumps([
+                    {'id': t[0], 'name': t[1], 'duration_seconds': t[2], 'created_at': t[3], 'expires_at': t[4]}
+                    for t in _rows_raw(conn, SQL_LIST)
+                ])
+                set_cached_list('json', seq, body)
+        return cacheable_response(seq, body, 'application/json')
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojson({'error': str(e)}, 500)
 
 @app.route('/timers/simple', methods=['GET'])
 @limiter.exempt  # Exempt this endpoint from rate limiting to stop 429 errors
 def list_timers_simple():
     """Simple endpoint for HTMX frontend - returns HTML fragments"""
     try:
-        conn = get_db_connection()
-        timers = conn.execute('SELECT * FROM timers').fetchall()
-        conn.close()
-        
-        now = datetime.now()
-        
-        if not timers:
-            return "<div class='empty-state'>No active timers. Create one above!</div>"
-        
-        html_parts = []
-        for timer in timers:
-            expires_at = datetime.fromisoformat(timer['expires_at'])
-            time_left = int((expires_at - now).total_seconds())
-            time_left = max(0, time_left)  # Ensure non‑negative
-            
-            # Format time left as HH:MM:SS
-            time_formatted = format_seconds(time_left)
-            
-            timer_name = timer['name'] if timer['name'] else f"Timer {timer['id'][:8]}"
-            expired_class = "expired" if time_left <= 0 else ""
+        with db_conn() as conn:
+            seq = conn.execute(SQL_TIMERS_SEQ).fetchone()[0]
+            if request.if_none_match.contains(str(seq)):
+                return cacheable_response(seq)
             
-            html_part = f'''
-            <div class="timer-item" data-timer-id="{timer['id']}">
-                <div class="timer-info">
-                    <div class="timer-name">{timer_name}</div>
-                    <div class="timer-time">
-                        <span class="time-left {expired_class}">{time_formatted}</span> left
-                        (created: {timer['created_at']})
-                    </div>
-                </div>
-                <div class="timer-actions">
-                    <button 
-                        class="delete-btn" 
-                        hx-delete="/timers/{timer['id']}" 
-                        hx-target="#timer-list"
-                    >
-                        Delete
-                    </button>
-                </div>
-            </div>
-            '''
-            html_parts.append(html_part)
-        
-        return '\n'.join(html_parts)
+            body = get_cached_list('html', seq)
+            if body is None:
+                body = render_timer_list_html(conn)
+                set_cached_list('html', seq, body)
+        return cacheable_response(seq, body, 'text/html')
     except Exception as e:
         app.logger.error(f"Error in simple timer list: {e}")
-        return f"<div class='empty-state'>Error loading timers: {str(e)}</div>"
+        return f"<div class='empty-state'>Error loading timers: {escape(str(e))}</div>"
+
+# Rendered /timers/simple rows keyed by timer id.  A row never changes while
+# its timer exists, so each is formatted once; rows of deleted timers drop out
+# whenever the fragment is rebuilt.
+_row_cache = {}
+
+def render_timer_row(timer: tuple) -> str:
+    """Format one /timers/simple row; the user-supplied name is escaped."""
+    raw_id, name, _, created_at, expires_at = timer
+    timer_id = escape(raw_id)
+    return _TIMER_ROW_HTML(
+        id=timer_id,
+        name=escape(name) if name else f"Timer {timer_id[:8]}",
+        expires_at=expires_at,
+        created_at=datetime.fromtimestamp(created_at).isoformat(),
+    )
+
+def render_timer_list_html(conn: sqlite3.Connection) -> str:
+    """Build the HTML fragment served by /timers/simple."""
+    global _row_cache
+    rows = {}
+    for timer in _rows_raw(conn, SQL_LIST):
+        row = _row_cache.get(timer[0])
+        rows[timer[0]] = row if row is not None else render_timer_row(timer)
+    _row_cache = rows
+    
+    if not rows:
+        return "<div class='empty-state'>No active timers. Create one above!</div>"
+    return '\n'.join(rows.values())
 
 @app.route('/')
+@limiter.exempt
 def index():
     """Serve the main HTML interface"""
     return render_template('index.html')
 
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    """Serve static files with proper cache headers"""
-    response = send_from_directory('static', filename)
-    
-    # Set cache headers for service worker and manifest
-    if filename == 'sw.js' or filename == 'manifest.json':
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
-    else:
-        # Cache other static assets for better performance
-        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
-    
-    return response
-
-@app.route('/static/icons/<path:filename>')
-def serve_icons(filename):
-    """Serve icon files with proper cache headers"""
-    response = send_from_directory('static/icons', filename)
-    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
-    return response
-
 @app.route('/test-alarm')
+@limiter.exempt
 def test_alarm():
     """Serve the alarm test page"""
     return send_from_directory('.', 'test_alarm.html')
@@ -335,34 +517,41 @@ def health_check():
     """Health check endpoint for monitoring"""
     try:
         # Check database connectivity
-        conn = get_db_connection()
-        conn.execute('SELECT 1')
-        conn.close()
-        return jsonify({
+        with db_conn() as conn:
+            conn.execute('SELECT 1')
+        return ojson({
             'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'service': 'webtimer'
-        }), 200
+        }, 200)
     except Exception as e:
         app.logger.error(f"Health check failed: {e}")
-        return jsonify({
+        return ojson({
             'status': 'unhealthy',
             'error': str(e)
-        }), 500
+        }, 500)
+
+# Built once; add_security_headers runs on every response.
+_SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'SAMEORIGIN'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Content-Security-Policy', "default-src 'self'; script-src 'self' https://unpkg.com 'unsafe-eval'; style-src 'self' 'unsafe-inline'; script-src-elem 'self' https://unpkg.com 'unsafe-inline'; script-src-attr 'unsafe-inline'"),
+)
 
 @app.after_request
 def add_security_headers(response):
     """Add security headers to all responses"""
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'SAMEORIGIN'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    response.headers['Content-Security-Policy'] = "default-src 'self'; script-src 'self' https://unpkg.com 'unsafe-eval'; style-src 'self' 'unsafe-inline'; script-src-elem 'self' https://unpkg.com 'unsafe-inline'; script-src-attr 'unsafe-inline'"
+    headers = response.headers
+    for key, value in _SECURITY_HEADERS:
+        headers.setdefault(key, value)
     return response
 
 if __name__ == '__main__':
     # This block is for development only
     # In production, Gunicorn will import the app from run_production.py
     init_db()
+    start_cleanup()
     
     # Determine if we're in debug mode based on environment
     debug_mode = app.config['DEBUG']
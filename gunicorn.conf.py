@@ -3,8 +3,11 @@ import os
 # Gunicorn configuration for WebTimer production deployment
 
 # Server Socket
-bind = "0.0.0.0:5000"
-backlog = 2048
+# Behind nginx a UNIX socket skips the TCP stack for every proxied request.
+# Set WEBTIMER_BIND (e.g. "0.0.0.0:5000") to listen on TCP instead; the
+# Docker image does so because it publishes port 5000 directly.
+bind = os.environ.get("WEBTIMER_BIND", "unix:/run/webtimer.sock")
+backlog = 4096
 
 # Worker Processes
 workers = 4  # Typically 2-4 x number of CPU cores
@@ -14,7 +17,7 @@ max_requests = 1000
 max_requests_jitter = 50
 timeout = 30
 graceful_timeout = 30
-keepalive = 2
+keepalive = 75  # Match nginx's keepalive_timeout so polling clients reuse connections
 
 # Logging
 accesslog = "-"  # stdout
@@ -30,6 +33,12 @@ def post_fork(server, worker):
     # Worker process initialization
     server.log.info("Worker spawned (pid: %s)", worker.pid)
 
+def post_worker_init(worker):
+    # Runs after the worker has applied gevent's monkey patches and loaded
+    # the app, so the cleanup loop is started as a greenlet in every worker.
+    from app import start_cleanup
+    start_cleanup()
+
 def pre_fork(server, worker):
     # Master process initialization
     pass
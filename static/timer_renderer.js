@@ -7,17 +7,18 @@
  *
  * Each rendered timer item contains:
  *   - A visible name (or "Unnamed" if none).
- *   - A span `.time-left` that is refreshed every 10 seconds via a GET request
- *     to `/timers/<id>`.
+ *   - A span `.time-left` carrying the timer's expiry (unix seconds) in
+ *     `data-expires`.
  *   - A delete button that issues a DELETE request to `/timers/<id>` and,
  *     on success, removes the timer element from the DOM.
  *
- * The module also starts a global interval that updates the time‑left for
- * every rendered timer.  This keeps the implementation simple and avoids
- * creating a separate interval per timer.
+ * The module also starts a global interval that recomputes the time‑left for
+ * every `.time-left[data-expires]` element on the page (including the HTML
+ * fragments served by `/timers/simple`) from the local clock, so no request
+ * is made per tick.
  */
 
-const TIMER_POLL_INTERVAL_MS = 10_000; // 10 seconds
+const TIMER_TICK_INTERVAL_MS = 1_000; // 1 second
 
 /**
  * Helper: perform a fetch request and return JSON (or null on error).
@@ -48,8 +49,9 @@ async function fetchJSON(url, options = {}) {
  * {
  *   id: string,
  *   name: string | null,
- *   time_left: string,   // formatted HH:MM:SS
- *   expired: boolean
+ *   duration_seconds: number,
+ *   created_at: number,  // unix epoch seconds
+ *   expires_at: number   // unix epoch seconds
  * }
  */
 function createTimerElement(timer) {
@@ -64,10 +66,7 @@ function createTimerElement(timer) {
 
     const timeSpan = document.createElement('span');
     timeSpan.className = 'time-left';
-    timeSpan.textContent = timer.time_left;
-    if (timer.expired) {
-        timeSpan.classList.add('expired');
-    }
+    timeSpan.dataset.expires = timer.expires_at;
     item.appendChild(timeSpan);
 
     const deleteBtn = document.createElement('button');
@@ -89,50 +88,70 @@ function createTimerElement(timer) {
 }
 
 /**
- * Refresh the `.time-left` element for a given timer DOM node.
+ * Format a non-negative number of seconds as HH:MM:SS.
  */
-async function refreshTimerItem(item) {
+function formatSeconds(seconds) {
+    const pad = n => String(n).padStart(2, '0');
+    const hours = Math.floor(seconds / 3600);
+    const minutes = Math.floor((seconds % 3600) / 60);
+    return `${pad(hours)}:${pad(minutes)}:${pad(seconds % 60)}`;
+}
+
+/**
+ * Recompute the `.time-left` element of a timer DOM node from its
+ * `data-expires` timestamp, starting the alarm once it runs out.
+ */
+function updateTimeLeft(item, timeSpan) {
     const timerId = item.dataset.timerId;
-    const data = await fetchJSON(`/timers/${timerId}`);
-    if (!data) return; // keep existing display on error
-
-    const timeSpan = item.querySelector('.time-left');
-    if (timeSpan) {
-        timeSpan.textContent = data.time_left;
-        if (data.expired) {
-            timeSpan.classList.add('expired');
-            // Start alarm if not already sounding
-            if (typeof alarmSystem !== 'undefined' && !alarmSystem.isAlarming(timerId)) {
-                alarmSystem.startAlarm(timerId);
-                // Add visual indicator
-                if (!item.querySelector('.alarm-indicator')) {
-                    const ind = document.createElement('span');
-                    ind.className = 'alarm-indicator';
-                    ind.title = 'Alarm sounding';
-                    timeSpan.appendChild(ind);
-                }
+    const expiresAt = Number(timeSpan.dataset.expires);
+    const timeLeft = Math.max(0, Math.ceil(expiresAt - Date.now() / 1000));
+    const text = formatSeconds(timeLeft);
+    // Only rewrite on change so an alarm indicator inside the span survives
+    if (timeSpan.firstChild?.nodeValue !== text) {
+        timeSpan.textContent = text;
+    }
+
+    if (timeLeft <= 0) {
+        timeSpan.classList.add('expired');
+        // Start alarm if not already sounding
+        if (typeof alarmSystem !== 'undefined' && !alarmSystem.isAlarming(timerId)) {
+            alarmSystem.startAlarm(timerId);
+            // Add visual indicator
+            if (!item.querySelector('.alarm-indicator')) {
+                const ind = document.createElement('span');
+                ind.className = 'alarm-indicator';
+                ind.title = 'Alarm sounding';
+                timeSpan.appendChild(ind);
             }
-        } else {
-            timeSpan.classList.remove('expired');
-            // Remove alarm indicator if timer recovered (unlikely)
-            const ind = item.querySelector('.alarm-indicator');
-            if (ind) ind.remove();
         }
+    } else {
+        timeSpan.classList.remove('expired');
     }
 }
 
+/**
+ * Update every rendered timer on the page.
+ */
+function tickTimers() {
+    document.querySelectorAll('.timer-item').forEach(item => {
+        const timeSpan = item.querySelector('.time-left[data-expires]');
+        if (timeSpan) updateTimeLeft(item, timeSpan);
+    });
+}
+
 /**
  * Global interval that updates all rendered timers.
  */
-let timerPoller = null;
-function startGlobalTimerPoller() {
-    if (timerPoller) clearInterval(timerPoller);
-    timerPoller = setInterval(() => {
-        const items = document.querySelectorAll('.timer-item');
-        items.forEach(item => refreshTimerItem(item));
-    }, TIMER_POLL_INTERVAL_MS);
+let timerTicker = null;
+function startGlobalTimerTicker() {
+    if (timerTicker) clearInterval(timerTicker);
+    timerTicker = setInterval(tickTimers, TIMER_TICK_INTERVAL_MS);
 }
 
+// Fragments swapped in by HTMX (e.g. from /timers/simple) get their time
+// filled in immediately rather than on the next tick.
+document.addEventListener('htmx:afterSwap', tickTimers);
+
 /**
  * Public function: fetch the list of timers and render them.
  *
@@ -162,8 +181,9 @@ async function fetchAndRenderTimers() {
         container.appendChild(el);
     });
 
-    // Start (or restart) the periodic poller
-    startGlobalTimerPoller();
+    // Fill in the time left now, then start (or restart) the periodic ticker
+    tickTimers();
+    startGlobalTimerTicker();
 }
 
 /**